@@ -60,9 +60,7 @@ class register_model_builder:
         cls._validate_func(build_fn)
 
         # Add function to available factories under this type
-        if type not in cls.factories:
-            cls.factories[type] = dict()
-        cls.factories[type][build_fn.__name__] = build_fn
+        cls.factories.setdefault(type, dict())[build_fn.__name__] = build_fn
 
     @staticmethod
     def _validate_func(func):